@@ -4,7 +4,8 @@
 #     "openpyxl",
 #     "pasteboard",
 #     "pyexiftool",
-#     "rich",
+#     "python-calamine",
+#     "rich>=13.8",
 #     "watchdog",
 # ]
 # ///
@@ -12,70 +13,370 @@
 # How this script was initialized
 #   uv init --script photo-session-article-helper.py --python 3.12
 #   uv add --script photo-session-article-helper.py openpyxl pasteboard pyexiftool rich watchdog
+#   uv add --script photo-session-article-helper.py python-calamine
+
+from __future__ import annotations
 
 import argparse
-import itertools
+import concurrent.futures
+import contextlib
+import csv
+import functools
+import hashlib
+import io
+import os
+import pickle
+import queue
+import re
+import stat
+import subprocess
+import sys
 import threading
-from dataclasses import dataclass
+import xml.etree.ElementTree as ET
+import zipfile
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import openpyxl
-import pasteboard
-from exiftool import ExifToolHelper
-from exiftool.exceptions import ExifToolExecuteException
 from rich.console import Console
 from rich.prompt import Prompt
 from rich.table import Table
 from watchdog.events import FileSystemEventHandler
-from watchdog.observers import Observer
 
-CONSOLE = Console()
+# heavy modules are imported where they are used, so --help and argument errors
+# return immediately
+if TYPE_CHECKING:
+    import pasteboard
+    from exiftool import ExifToolHelper
+    from watchdog.observers.api import BaseObserver
+
+# all colors are set by markup, skip the regex based highlighting of every message
+CONSOLE = Console(highlight=False, soft_wrap=True)
+CACHE_PATH = Path.home() / ".cache/brand-images"
+# increase whenever Article changes, so old cache files are ignored
+EXCEL_CACHE_VERSION = 1
 FILE_EXTENSION = ".NEF"
-
-
-@dataclass
+PHOTO_TIMEOUT = 15 * 60  # seconds
+NEXT_ACTION_CHOICES = ["w", "n"]  # wiederholen, nächster Artikel
+SIDE_CHOICES = ["v", "r"]  # Vorderseite, Rückseite
+NETWORK_FILESYSTEMS = {
+    "afpfs",
+    "cifs",
+    "fuse.sshfs",
+    "nfs",
+    "nfs4",
+    "smb3",
+    "smbfs",
+    "webdav",
+}
+
+# file names in the watch folder, listed once and then kept up to date by the observer
+_existing_filenames: set[str] | None = None
+# results of the background IPTC writer, printed before the next prompt
+_iptc_messages: queue.SimpleQueue[str] = queue.SimpleQueue()
+
+
+@dataclass(slots=True, frozen=True)
 class Article:
     identity_no: str  # Identnummer
     sheet: str  # Tabellenblatt
     article_no: str  # ArtikelNr
     article_desc: str  # Artikelbezeichnung
     color_no: str  # Farbe
+    # file name without side and extension, derived from the fields above
+    filename_stem: str = field(compare=False, repr=False)
 
 
 class PhotoCreationHandler(FileSystemEventHandler):
-    def __init__(self, target_file: str):
-        self.target_file = target_file
-        self.file_created = threading.Event()
+    """Notify the waiting photo by file name, shared for the whole session."""
+
+    def __init__(self, watch_path: Path):
+        self._watch_dir = watch_path.resolve()
+        self._lock = threading.Lock()
+        self._expected_files: dict[str, threading.Event] = {}
+
+    def expect(self, target_file: str) -> threading.Event:
+        file_created = threading.Event()
+        with self._lock:
+            self._expected_files[target_file] = file_created
+        return file_created
+
+    def forget(self, target_file: str) -> None:
+        with self._lock:
+            self._expected_files.pop(target_file, None)
 
     def on_created(self, event):
-        if not event.is_directory and Path(event.src_path).name == self.target_file:
-            self.file_created.set()
+        if event.is_directory:
+            return
+        name = Path(event.src_path).name
+        if _existing_filenames is not None:
+            _existing_filenames.add(name)
+        with self._lock:
+            file_created = self._expected_files.get(name)
+        if file_created is not None:
+            file_created.set()
+
+    def on_deleted(self, event):
+        if not event.is_directory and _existing_filenames is not None:
+            _existing_filenames.discard(Path(event.src_path).name)
+
+    def on_moved(self, event):
+        if event.is_directory or _existing_filenames is None:
+            return
+        src_path, dest_path = Path(event.src_path), Path(event.dest_path)
+        if src_path.parent.resolve() == self._watch_dir:
+            _existing_filenames.discard(src_path.name)
+        if dest_path.parent.resolve() == self._watch_dir:
+            _existing_filenames.add(dest_path.name)
+
+
+def unescape_mount_point(mount_point: str) -> Path:
+    # /proc/mounts escapes special characters as octal, e.g. space as \040
+    return Path(re.sub(r"\\([0-7]{3})", lambda m: chr(int(m[1], 8)), mount_point))
+
+
+def mounted_filesystems() -> list[tuple[Path, str]]:
+    """Return mount point and file system type of all mounted file systems."""
+    if sys.platform == "linux":
+        with open("/proc/mounts") as mounts:
+            return [
+                (unescape_mount_point(fields[1]), fields[2])
+                for fields in (line.split() for line in mounts)
+            ]
+    if sys.platform == "darwin":
+        # e.g. "//user@server/share on /Volumes/share (smbfs, nodev, nosuid)"
+        try:
+            output = subprocess.run(
+                ["mount"], capture_output=True, text=True, check=True
+            ).stdout
+        except (OSError, subprocess.CalledProcessError):
+            # unknown mounts, the native observer is used
+            return []
+        return [
+            (Path(match[1]), match[2])
+            for match in re.finditer(r"^.+ on (.+) \(([^,)]+)", output, re.MULTILINE)
+        ]
+    return []
+
+
+def is_network_path(path: Path) -> bool:
+    """Check if the path is located on a network file system (NFS, SMB, ...)."""
+    path = path.resolve()
+    # reversed: a later entry for the same mount point wins, e.g. the nfs mount
+    # listed after its autofs trigger
+    mounts = [
+        (mount_point, fs_type)
+        for mount_point, fs_type in reversed(mounted_filesystems())
+        if path.is_relative_to(mount_point)
+    ]
+    if not mounts:
+        return False
+    _, fs_type = max(mounts, key=lambda mount: len(mount[0].parts))
+    return fs_type in NETWORK_FILESYSTEMS
+
+
+def make_observer(watch_path: Path, poll_interval: float) -> BaseObserver:
+    """Use native file system events, polling is only needed on network mounts."""
+    if is_network_path(watch_path):
+        from watchdog.observers.polling import PollingObserver
+
+        CONSOLE.print(
+            "- Netzlaufwerk erkannt, prüfe alle "
+            f"[dark_orange]{poll_interval}[/] Sekunden auf neue Fotos"
+        )
+        return PollingObserver(timeout=poll_interval)
 
+    from watchdog.observers import Observer
 
-def read_excel_data(excel_file: Path) -> dict[str, Article]:
-    excel_data = {}
+    return Observer()
 
-    wb = openpyxl.load_workbook(excel_file)
-    sheet = wb.active
 
-    for sheet, identity_no, article_no, color_no, article_desc in sheet.rows:
-        # ignore lines without data (header, heading, empty lines)
-        if article_no.value is None:
-            continue
-        if article_no.value == "ArtikelNr":
-            continue
+def build_filename_stem(article_no: str, color_no: str, article_desc: str) -> str:
+    article_desc = article_desc.replace(".", "").replace(" ", "-")
+    return f"{article_no}_{color_no}_{article_desc}"
 
-        if identity_no.value in excel_data:
-            raise ValueError(f"Identnummer '{article_no.value}' ist doppelt vorhanden!")
 
-        # read data
-        excel_data[str(identity_no.value)] = Article(
-            sheet=str(sheet.value),
-            identity_no=str(identity_no.value),
-            article_no=str(article_no.value),
-            color_no=str(color_no.value),
-            article_desc=str(article_desc.value),
-        )
+def active_sheet_index(excel_file: Path) -> int:
+    """Return the index of the sheet which was active when the file was saved."""
+    try:
+        with zipfile.ZipFile(excel_file) as z, z.open("xl/workbook.xml") as f:
+            for _, element in ET.iterparse(f):
+                if element.tag.endswith("}workbookView"):
+                    return int(element.get("activeTab", 0))
+    except (zipfile.BadZipFile, KeyError):
+        # not an .xlsx file (e.g. .xls or .ods)
+        pass
+    return 0
+
+
+def normalize_cell_value(value):
+    """Return cell values like openpyxl does: None for empty and int for integers."""
+    if value == "":
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def iter_rows_calamine(excel_file: Path) -> Iterator[tuple]:
+    from python_calamine import CalamineWorkbook
+
+    wb = CalamineWorkbook.from_path(str(excel_file))
+    try:
+        sheet = wb.get_sheet_by_index(active_sheet_index(excel_file))
+        # rows start at cell A1 like in openpyxl, iter_rows() would start at the
+        # first used column and shift all indexes if column A is empty
+        for row in sheet.to_python(skip_empty_area=False):
+            yield tuple(normalize_cell_value(value) for value in row)
+    finally:
+        wb.close()
+
+
+def iter_rows_openpyxl(excel_file: Path) -> Iterator[tuple]:
+    import openpyxl
+
+    wb = openpyxl.load_workbook(
+        excel_file, read_only=True, data_only=True, keep_links=False
+    )
+    try:
+        yield from wb.active.iter_rows(values_only=True)
+    finally:
+        # read-only workbooks keep the underlying zip file open
+        wb.close()
+
+
+def iter_rows_csv(csv_file: Path) -> Iterator[tuple]:
+    try:
+        text = csv_file.read_text(encoding="utf-8-sig")
+    except UnicodeDecodeError:
+        # Excel's default "CSV (Trennzeichen-getrennt)" export uses Windows-1252
+        text = csv_file.read_text(encoding="cp1252")
+
+    # the delimiter is the one used in the header line
+    header = next((line for line in text.splitlines() if "ArtikelNr" in line), "")
+    delimiter = max(",;\t", key=header.count)
+
+    for row in csv.reader(io.StringIO(text, newline=""), delimiter=delimiter):
+        # empty cells are None like in the excel readers
+        yield tuple(value or None for value in row)
+
+
+def article_from_row(row: tuple) -> Article:
+    # columns: Tabellenblatt, Identnummer, ArtikelNr, Farbe, Artikelbezeichnung
+    # trailing empty cells may be missing, additional columns are ignored
+    if len(row) < 5:
+        row += (None,) * (5 - len(row))
+
+    # repeated values (sheet, article, color) share one string each
+    article_no = sys.intern(str(row[2]))
+    color_no = sys.intern(str(row[3]))
+    article_desc = str(row[4])
+    return Article(
+        sheet=sys.intern(str(row[0])),
+        identity_no=sys.intern(str(row[1])),
+        article_no=article_no,
+        color_no=color_no,
+        article_desc=article_desc,
+        filename_stem=build_filename_stem(article_no, color_no, article_desc),
+    )
+
+
+def parse_rows(rows: Iterator[tuple]) -> dict[str, Article]:
+    with contextlib.closing(rows):
+        # skip everything up to and including the header (heading, empty lines)
+        for row in rows:
+            if len(row) > 2 and row[2] == "ArtikelNr":
+                break
+        else:
+            raise ValueError("Spalte 'ArtikelNr' nicht gefunden!")
+
+        # read data, ignore lines without data (empty lines) and repeated headers
+        articles = [
+            article_from_row(row)
+            for row in rows
+            if len(row) > 2 and row[2] is not None and row[2] != "ArtikelNr"
+        ]
+
+    excel_data = {article.identity_no: article for article in articles}
+    if len(excel_data) != len(articles):
+        counts = Counter(article.identity_no for article in articles)
+        identity_no = next(no for no, count in counts.items() if count > 1)
+        raise ValueError(f"Identnummer '{identity_no}' ist doppelt vorhanden!")
+
+    return excel_data
+
+
+def parse_excel_data(
+    excel_file: Path, legacy_excel: bool = False
+) -> dict[str, Article]:
+    if legacy_excel:
+        iter_rows = iter_rows_openpyxl
+    else:
+        # calamine (Rust) is the fastest reader, openpyxl is used where it can't be
+        # installed (no wheel for the platform)
+        try:
+            import python_calamine  # noqa: F401
+
+            iter_rows = iter_rows_calamine
+        except ImportError:
+            iter_rows = iter_rows_openpyxl
+
+    return parse_rows(iter_rows(excel_file))
+
+
+def read_csv_data(csv_file: Path) -> dict[str, Article]:
+    # reading CSV is fast already, so it isn't cached
+    csv_data = parse_rows(iter_rows_csv(csv_file))
+    CONSOLE.print(
+        f"- Anzahl an Artikeldaten in der CSV-Datei: [dark_orange]{len(csv_data)}[/]"
+    )
+    return csv_data
+
+
+def load_cached_excel_data(cache_file: Path, cache_key: tuple) -> dict | None:
+    try:
+        with cache_file.open("rb") as f:
+            cached_key, cached_data = pickle.load(f)
+    except (
+        OSError, EOFError, pickle.PickleError, AttributeError, TypeError, ValueError
+    ):
+        # no or unreadable cache file
+        return None
+    if cached_key != cache_key:
+        return None
+
+    CONSOLE.print("- Artikeldaten aus dem Cache geladen")
+    # unpickled strings are not interned anymore
+    return {sys.intern(key): article for key, article in cached_data.items()}
+
+
+def read_excel_data(
+    excel_file: Path, legacy_excel: bool = False
+) -> dict[str, Article]:
+    """Read the article data, reuse the cached result if the file is unchanged."""
+    file_stat = excel_file.stat()
+    cache_key = (EXCEL_CACHE_VERSION, file_stat.st_mtime_ns, file_stat.st_size)
+    path_hash = hashlib.sha256(str(excel_file.resolve()).encode()).hexdigest()[:16]
+    cache_file = CACHE_PATH / f"excel-{path_hash}.pkl"
+
+    # --legacy-excel should really read the file with openpyxl
+    excel_data = None if legacy_excel else load_cached_excel_data(cache_file, cache_key)
+    if excel_data is None:
+        excel_data = parse_excel_data(excel_file, legacy_excel)
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # write a temporary file first, so no one ever reads a half written file
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                with tmp_file.open("wb") as f:
+                    pickle.dump((cache_key, excel_data), f, protocol=5)
+                os.replace(tmp_file, cache_file)
+            finally:
+                tmp_file.unlink(missing_ok=True)
+        except OSError as except_inst:
+            CONSOLE.print(f"[light_pink3]Cache nicht geschrieben: {except_inst}[/]")
 
     CONSOLE.print(
         f"- Anzahl an Artikeldaten im Excel: [dark_orange]{len(excel_data)}[/]"
@@ -85,6 +386,7 @@ def read_excel_data(excel_file: Path) -> dict[str, Article]:
 
 def ask_for_article_by_identity_no(excel_data) -> Article | None:
     while True:
+        print_iptc_messages()
         CONSOLE.print("")
         CONSOLE.print("=" * 70)
 
@@ -92,6 +394,9 @@ def ask_for_article_by_identity_no(excel_data) -> Article | None:
         if not identity_no:
             return
 
+        # the dict keys are interned, so a match is found by identity
+        identity_no = sys.intern(identity_no)
+
         article = excel_data.get(identity_no)
         if article is None:
             CONSOLE.print(f"[light_pink3]Identnummer '{identity_no}' nicht gefunden.")
@@ -101,82 +406,149 @@ def ask_for_article_by_identity_no(excel_data) -> Article | None:
 
 
 def ask_for_next_action() -> str:
-    while True:
-        choice = Prompt.ask(
-            "Drücke [bold]w[/]iederholen oder [bold]n[/]ächster Artikel",
-            choices=["w", "n"],
-        )
-        return choice
+    print_iptc_messages()
+    return Prompt.ask(
+        "Drücke [bold]w[/]iederholen oder [bold]n[/]ächster Artikel",
+        choices=NEXT_ACTION_CHOICES,
+        case_sensitive=False,
+    )
 
 
 def ask_for_side() -> str:
-    return Prompt.ask("Vorder- oder Rückseite?", choices=["v", "r"])
+    print_iptc_messages()
+    return Prompt.ask(
+        "Vorder- oder Rückseite?", choices=SIDE_CHOICES, case_sensitive=False
+    )
+
+
+def existing_filenames(watch_path: Path) -> set[str]:
+    global _existing_filenames
+    if _existing_filenames is None:
+        with os.scandir(watch_path) as entries:
+            _existing_filenames = {entry.name for entry in entries}
+    return _existing_filenames
 
 
 def generate_new_filename(article: Article, side: str, watch_path: Path) -> Path:
-    article_desc = article.article_desc.replace(".", "").replace(" ", "-")
-
-    filename_template = "{article_no}_{color_no}_{article_desc}_{side}"
-    filename_parts = {
-        "article_no": article.article_no,
-        "color_no": article.color_no,
-        "article_desc": article_desc,
-        "side": side,
+    stem = f"{article.filename_stem}_{side}"
+    existing = existing_filenames(watch_path)
+
+    # if file already exists, add counter (starting with 1) at the end of the filename
+    filename = stem + FILE_EXTENSION
+    i = 1
+    while filename in existing:
+        filename = f"{stem}_{i}{FILE_EXTENSION}"
+        i += 1
+
+    return Path(filename)
+
+
+def iptc_tags(article: Article, side: str) -> dict[str, str]:
+    return {
+        "IPTC:ObjectName": article.article_no,
+        "IPTC:Category": side,
+        "IPTC:Caption-Abstract": article.article_desc,
+        "IPTC:Headline": article.color_no,
     }
-    filename = filename_template.format(**filename_parts)
 
-    for i in itertools.count(1):
-        filename = Path(filename).with_suffix(FILE_EXTENSION)
-        if not (watch_path / filename).exists():
-            break
 
-        # if file already exists, add counter (starting with 1) ad the end of the filename
-        filename = f"{filename_template}_{i}".format(**filename_parts)
+def write_iptc_data(et: ExifToolHelper, path: Path, tags: dict[str, str]) -> str:
+    """Write the IPTC tags of one photo and return the message to show."""
+    from exiftool.exceptions import ExifToolExecuteException
 
-    return filename
+    # one execute per photo, pyexiftool only checks the exit status of the last
+    # command of a call
+    try:
+        et.execute(*(f"-{tag}={value}" for tag, value in tags.items()), path)
+    except ExifToolExecuteException as except_inst:
+        return f"[light_pink3]{except_inst.stderr}[/]"
+
+    return f"[green]IPTC Daten von [bold]'{path.name}'[/] erfolgreich aktualisiert[/]"
+
+
+@contextlib.contextmanager
+def exiftool_session() -> Iterator[ExifToolHelper]:
+    """Start one exiftool process (-stay_open) for the whole session."""
+    from exiftool import ExifToolHelper
+
+    # -overwrite_original: no "*_original" backup copies in the watch folder
+    # -P: keep the file modification date of the photos
+    et = ExifToolHelper(common_args=["-G", "-n", "-overwrite_original", "-P"])
+    # a new session keeps exiftool out of the terminal's process group, so Ctrl-C
+    # doesn't stop it before the queued IPTC data is written (exiftool would die
+    # in the middle of execute() and pyexiftool would wait for it forever)
+    popen = subprocess.Popen
+    subprocess.Popen = functools.partial(popen, start_new_session=True)
+    try:
+        et.run()
+    finally:
+        # pyexiftool has no option for the Popen arguments
+        subprocess.Popen = popen
+
+    try:
+        yield et
+    finally:
+        if et.running:
+            et.terminate()
+
+
+def iptc_writer(et: ExifToolHelper, photos: queue.Queue) -> None:
+    """Write queued IPTC data, the results are printed before the next prompt."""
+    while True:
+        path, tags = photos.get()
+        try:
+            _iptc_messages.put(write_iptc_data(et, path, tags))
+        except Exception as except_inst:
+            # keep the writer alive, e.g. if exiftool was stopped by Ctrl-C
+            _iptc_messages.put(f"[light_pink3]{except_inst}[/]")
+        finally:
+            photos.task_done()
+
+
+def print_iptc_messages() -> None:
+    # printing from the writer thread would break into the active prompt line
+    while True:
+        try:
+            CONSOLE.print(_iptc_messages.get_nowait())
+        except queue.Empty:
+            return
 
 
 def set_clipboard_and_wait_for_photo(
-    pb: pasteboard.Pasteboard, article: Article, watch_path: Path
+    pb: pasteboard.Pasteboard,
+    photos: queue.Queue,
+    event_handler: PhotoCreationHandler,
+    article: Article,
+    watch_path: Path,
 ):
     side = ask_for_side()
     filename = generate_new_filename(article, side, watch_path)
 
-    # Set clipboard content
-    pb.set_contents(filename.stem)
-    CONSOLE.print(
-        f"[green]Filename [bold]'{pb.get_contents()}'[/][/]"
-    )
-
-    # Set up file system observer
-    event_handler = PhotoCreationHandler(str(filename))
-    observer = Observer()
-    observer.schedule(event_handler, str(watch_path), recursive=False)
-    observer.start()
+    # Register the expected file before the clipboard is set, so it can't be missed
+    file_created = event_handler.expect(str(filename))
+
+    # Set clipboard content, the clipboard isn't read back
+    if pb.set_contents(filename.stem):
+        CONSOLE.print(f"[green]Filename [bold]'{filename.stem}'[/][/]")
+    else:
+        # the clipboard still holds the previous name
+        CONSOLE.print(
+            f"[light_pink3]Filename [bold]'{filename.stem}'[/] konnte nicht in die "
+            "Zwischenablage kopiert werden[/]"
+        )
 
     # Wait for file creation or timeout
     try:
-        result = event_handler.file_created.wait()
+        result = file_created.wait(timeout=PHOTO_TIMEOUT)
         if result:
-            try:
-                with ExifToolHelper() as et:
-                    et.set_tags(
-                        watch_path / filename,
-                        {
-                            "IPTC:ObjectName": article.article_no,
-                            "IPTC:Category": side,
-                            "IPTC:Caption-Abstract": article.article_desc,
-                            "IPTC:Headline": article.color_no,
-                        },
-                    )
-                CONSOLE.print(
-                    f"[green]IPTC Daten von [bold]'{filename}'[/] erfolgreich aktualisiert[/]"
-                )
-            except ExifToolExecuteException as except_inst:
-                CONSOLE.print(f"[light_pink3]{except_inst.stderr}[/]")
+            photos.put((watch_path / filename, iptc_tags(article, side)))
+        else:
+            CONSOLE.print(
+                f"[light_pink3]Kein Foto [bold]'{filename}'[/] "
+                f"innerhalb von {PHOTO_TIMEOUT // 60} Minuten erhalten[/]"
+            )
     finally:
-        observer.stop()
-        observer.join()
+        event_handler.forget(str(filename))
 
 
 def print_article_info(article: Article) -> None:
@@ -197,9 +569,15 @@ def print_article_info(article: Article) -> None:
     CONSOLE.print(table)
 
 
-def process_article(article: Article, pb: pasteboard.Pasteboard, watch_path: Path):
+def process_article(
+    article: Article,
+    pb: pasteboard.Pasteboard,
+    photos: queue.Queue,
+    event_handler: PhotoCreationHandler,
+    watch_path: Path,
+):
     while True:
-        set_clipboard_and_wait_for_photo(pb, article, watch_path)
+        set_clipboard_and_wait_for_photo(pb, photos, event_handler, article, watch_path)
         choice = ask_for_next_action()
         if choice == "n":
             break
@@ -208,9 +586,17 @@ def process_article(article: Article, pb: pasteboard.Pasteboard, watch_path: Pat
 def valid_path(path_str: str) -> Path:
     """Validate if path exists and return Path object."""
     path = Path(path_str)
-    if not path.exists():
-        path.mkdir(parents=True, exist_ok=True)
-    if not path.is_dir():
+    # a single stat() call, the path is only created if it doesn't exist
+    try:
+        is_dir = stat.S_ISDIR(path.stat().st_mode)
+    except (FileNotFoundError, NotADirectoryError):
+        try:
+            path.mkdir(parents=True)
+            is_dir = True
+        except (FileExistsError, NotADirectoryError):
+            # e.g. a broken symbolic link or a file within the path
+            is_dir = False
+    if not is_dir:
         raise argparse.ArgumentTypeError(
             f"Der Pfad '{path.absolute()}' ist kein Verzeichnis."
         )
@@ -220,65 +606,130 @@ def valid_path(path_str: str) -> Path:
 def valid_file(path_str: str) -> Path:
     """Validate if file exists and return Path object."""
     filename = Path(path_str)
-    if not filename.exists():
+    try:
+        is_file = stat.S_ISREG(filename.stat().st_mode)
+    except (FileNotFoundError, NotADirectoryError):
         raise argparse.ArgumentTypeError(
             f"Die Datei '{filename.absolute()}' existiert nicht."
-        )
-    if not filename.is_file():
+        ) from None
+    if not is_file:
         raise argparse.ArgumentTypeError(
             f"Die Datei '{filename.absolute()}' ist kein File."
         )
     return filename
 
 
+def valid_poll_interval(value_str: str) -> float:
+    """Validate if the poll interval is a positive number and return it."""
+    try:
+        poll_interval = float(value_str)
+    except ValueError:
+        poll_interval = None
+    # NaN and inf are rejected as well, 0 would poll the network share in a tight loop
+    if poll_interval is None or not 0 < poll_interval < float("inf"):
+        raise argparse.ArgumentTypeError(
+            f"Das Abfrageintervall '{value_str}' ist keine positive Zahl."
+        )
+    return poll_interval
+
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
         description="Verarbeitet Produktfotos mit Artikelnummern aus einer Excel-Datei"
     )
-    parser.add_argument(
+    article_file = parser.add_mutually_exclusive_group(required=True)
+    article_file.add_argument(
         "--excel",
         dest="excel_file",
-        required=True,
         type=valid_file,
         help="Excel-Datei mit den Artikeldaten",
     )
+    article_file.add_argument(
+        "--csv",
+        dest="csv_file",
+        type=valid_file,
+        help="CSV-Datei mit den Artikeldaten (als CSV gespeicherte Excel-Datei)",
+    )
+    parser.add_argument(
+        "--legacy-excel",
+        dest="legacy_excel",
+        action="store_true",
+        help="Excel-Datei mit openpyxl lesen (langsamer, falls es Probleme gibt)",
+    )
     parser.add_argument(
         "--watch",
         dest="watch_path",
         type=valid_path,
-        default=Path.home() / Path(".cache/brand-images/photos"),
+        # argparse applies type=valid_path to string defaults as well
+        default=str(CACHE_PATH / "photos"),
         help="Verzeichnis, welches auf neue Fotos überwacht wird",
     )
+    parser.add_argument(
+        "--poll-interval",
+        dest="poll_interval",
+        type=valid_poll_interval,
+        default=5.0,
+        help="Abfrageintervall in Sekunden für Verzeichnisse auf einem Netzlaufwerk",
+    )
 
     args = parser.parse_args()
 
-    # Explicitly validate the watch_path whether it was provided or is using the default
-    args.watch_path = valid_path(args.watch_path)
-
     CONSOLE.print(f"- Suche Fotos in [dark_orange]{args.watch_path.absolute()}[/]")
+    article_file = args.csv_file or args.excel_file
     CONSOLE.print(
-        f"- Lese die Artikeldaten von [dark_orange]{args.excel_file.absolute()}[/]"
+        f"- Lese die Artikeldaten von [dark_orange]{article_file.absolute()}[/]"
     )
     return args
 
 
 def main():
     args = parse_args()
-    excel_data = read_excel_data(args.excel_file)
-    pb = pasteboard.Pasteboard()
 
-    try:
-        while True:
-            article = ask_for_article_by_identity_no(excel_data)
-            if article is None:
-                break
+    import pasteboard
+
+    # read the article data in the background, the pasteboard must be created on the
+    # main thread (macOS)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        if args.csv_file is not None:
+            excel_future = executor.submit(read_csv_data, args.csv_file)
+        else:
+            excel_future = executor.submit(
+                read_excel_data, args.excel_file, args.legacy_excel
+            )
+        pb = pasteboard.Pasteboard()
+        excel_data = excel_future.result()
+
+    # one file system observer is used for the whole session
+    event_handler = PhotoCreationHandler(args.watch_path)
+    observer = make_observer(args.watch_path, args.poll_interval)
+    observer.schedule(event_handler, str(args.watch_path), recursive=False)
+    observer.start()
 
-            print_article_info(article)
-            process_article(article, pb, args.watch_path)
+    try:
+        # the IPTC data is written in the background while the next photo is prepared
+        with exiftool_session() as et:
+            photos = queue.Queue(maxsize=100)
+            threading.Thread(target=iptc_writer, args=(et, photos), daemon=True).start()
+            try:
+                while True:
+                    article = ask_for_article_by_identity_no(excel_data)
+                    if article is None:
+                        break
+
+                    print_article_info(article)
+                    process_article(article, pb, photos, event_handler, args.watch_path)
+            finally:
+                # write outstanding IPTC data before exiftool is stopped, also on Ctrl-C
+                photos.join()
+                print_iptc_messages()
 
     except KeyboardInterrupt:
         ...
+    finally:
+        # the observer thread is a daemon, don't let a hanging backend block the exit
+        observer.stop()
+        observer.join(timeout=1.0)
 
 
 if __name__ == "__main__":